@@ -1,7 +1,13 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, exc
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import StaticPool
 import os
-from typing import Generator
+import threading
+import time
+from typing import AsyncGenerator
 
 # DATABASE_URL 환경변수 사용 (Azure App Service Bicep 배포 시 DATABASE_URL로 주입됨)
 # 또는 로컬에서 AZURE_SQL_CONNECTIONSTRING 대신 DATABASE_URL 사용 권장
@@ -18,16 +24,185 @@ if not database_url:
         raise ValueError("DATABASE_URL (or AZURE_SQL_CONNECTIONSTRING) environment variable not set")
     raise ValueError("DATABASE_URL environment variable not set")
 
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# DB 종류별 기본 풀 프로필.
+# uvicorn 워커마다 풀이 따로 생기므로 (워커 수 * (pool_size + max_overflow))가
+# DB의 max_connections를 넘지 않도록 환경변수로 조정한다.
+POOL_PROFILES = {
+    "postgresql": {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,  # Azure PostgreSQL 유휴 연결 정리 전에 재생성
+        "pool_pre_ping": True,
+        "query_cache_size": 500,
+    },
+    "sqlite": {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": -1,
+        "pool_pre_ping": False,
+        "query_cache_size": 500,
+    },
+}
+
+
+# 동기 드라이버 <-> 비동기 드라이버 매핑 (API는 비동기, scripts/는 동기 엔진 사용)
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+SYNC_DRIVERS = {"postgresql": "psycopg2", "sqlite": "pysqlite"}
+
+
+def _with_driver(url: str, drivers: dict) -> str:
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in drivers:
+        return url
+    return parsed.set(drivername=f"{backend}+{drivers[backend]}").render_as_string(hide_password=False)
+
+
+def async_url(url: str) -> str:
+    """postgresql:// -> postgresql+asyncpg://, sqlite:// -> sqlite+aiosqlite://"""
+    return _with_driver(url, ASYNC_DRIVERS)
+
+
+def sync_url(url: str) -> str:
+    """비동기 드라이버로 들어온 URL을 동기 드라이버 URL로 변환 (scripts/ 용)"""
+    return _with_driver(url, SYNC_DRIVERS)
+
+
+def engine_options(url: str) -> dict:
+    """DATABASE_URL에 맞는 create_engine 인자 (프로필 + DB_* 환경변수 오버라이드)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    profile = POOL_PROFILES.get(backend, POOL_PROFILES["postgresql"])
+
+    options = {
+        "echo": _env_bool("DB_ECHO", False),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", profile["pool_pre_ping"]),
+        "query_cache_size": _env_int("DB_STATEMENT_CACHE_SIZE", profile["query_cache_size"]),
+    }
+
+    if parsed.get_driver_name() == "asyncpg":
+        # asyncpg는 커넥션 단위 prepared statement 캐시를 따로 가짐
+        options["connect_args"] = {
+            "prepared_statement_cache_size": _env_int("DB_STATEMENT_CACHE_SIZE", 100),
+        }
+
+    if backend == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        database = parsed.database
+        if not database or database == ":memory:":
+            # 메모리 DB는 연결마다 DB가 새로 생기므로 단일 연결을 공유 (풀 크기 설정 불가)
+            options["poolclass"] = StaticPool
+            return options
+
+    options.update(
+        pool_size=_env_int("DB_POOL_SIZE", profile["pool_size"]),
+        max_overflow=_env_int("DB_MAX_OVERFLOW", profile["max_overflow"]),
+        pool_timeout=_env_int("DB_POOL_TIMEOUT", profile["pool_timeout"]),
+        pool_recycle=_env_int("DB_POOL_RECYCLE", profile["pool_recycle"]),
+    )
+    return options
+
+
+class PoolStats:
+    """커넥션 체크아웃 대기 시간 / 타임아웃 누적 통계 (워커 프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            avg = self.wait_total / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts_total": self.checkouts,
+                "checkout_timeouts_total": self.timeouts,
+                "wait_ms_avg": round(avg * 1000, 3),
+                "wait_ms_max": round(self.wait_max * 1000, 3),
+            }
+
+
 # PostgreSQL 연결 (DATABASE_URL이 postgresql:// 형태로 들어온다고 가정)
 connection_string = database_url
-engine = create_engine(connection_string, echo=False)
+
+# 동기 엔진: 테이블 생성, scripts/seed.py 등 요청 처리 밖에서만 사용
+engine = create_engine(sync_url(connection_string), **engine_options(sync_url(connection_string)))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 비동기 엔진: 라우터는 모두 AsyncSession을 사용 (이벤트 루프를 막지 않도록)
+async_engine = create_async_engine(async_url(connection_string), **engine_options(async_url(connection_string)))
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
+pool_stats = PoolStats()
+
 
-def get_db() -> Generator:
-    """FastAPI 의존성: DB 세션 반환"""
-    db = SessionLocal()
-    try:
+def pool_status() -> dict:
+    """현재 풀 상태 (checked out / overflow 등) + 대기 시간 통계"""
+    pool = async_engine.pool
+    status = {
+        "pid": os.getpid(),
+        "pool_class": type(pool).__name__,
+    }
+    # StaticPool 등은 size/overflow 개념이 없음
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, name):
+            status[name] = getattr(pool, name)()
+    status.update(pool_stats.snapshot())
+    return status
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI 의존성: 비동기 DB 세션 반환"""
+    async with AsyncSessionLocal() as db:
+        # 커넥션을 먼저 잡아서 풀 대기 시간을 측정
+        started = time.perf_counter()
+        try:
+            await db.connection()
+        except exc.TimeoutError:
+            pool_stats.record_timeout()
+            raise
+        pool_stats.record_wait(time.perf_counter() - started)
         yield db
-    finally:
-        db.close()
+
+
+def dialect_insert(dialect_name: str):
+    """ON CONFLICT(upsert)를 지원하는 DB별 insert() (PostgreSQL / SQLite)"""
+    if dialect_name == "postgresql":
+        return postgresql.insert
+    if dialect_name == "sqlite":
+        return sqlite.insert
+    raise NotImplementedError(f"upsert is not supported for {dialect_name}")
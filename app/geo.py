@@ -0,0 +1,88 @@
+import math
+
+# Geohash: 위/경도를 base32 문자열로 인코딩. 앞자리가 같으면 같은 격자 셀에 속하므로
+# B-tree 인덱스의 범위 검색(prefix 범위)만으로 "근처" 후보를 찾을 수 있다.
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9  # 약 4.8m x 4.8m
+EARTH_RADIUS_M = 6_371_000
+METERS_PER_DEGREE = 111_320
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bit, ch, even = 0, 0, True
+    while len(chars) < precision:
+        # 짝수 비트는 경도, 홀수 비트는 위도
+        rng, value = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            ch = (ch << 1) | 1
+            rng[0] = mid
+        else:
+            ch = ch << 1
+            rng[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(BASE32[ch])
+            bit, ch = 0, 0
+    return "".join(chars)
+
+
+def cell_size_degrees(precision: int) -> tuple[float, float]:
+    """precision 자리 geohash 셀의 (위도 높이, 경도 폭) - 단위: 도"""
+    bits = precision * 5
+    lng_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def cover_cells(latitude: float, longitude: float, radius_m: float) -> list[str]:
+    """
+    반경 radius_m 원을 덮는 geohash 셀 목록.
+    셀 한 변이 반경 이상인 가장 작은 셀을 고른 뒤 중심 셀과 주변 8칸을 반환한다.
+    """
+    radius_deg = radius_m / METERS_PER_DEGREE
+    # 극쪽 가장자리에서 경도 1도가 가장 짧으므로 그 위도로 폭을 계산
+    edge_lat = min(abs(latitude) + radius_deg, 89.9)
+    meters_per_lng_degree = METERS_PER_DEGREE * math.cos(math.radians(edge_lat))
+
+    precision = 1
+    for p in range(GEOHASH_PRECISION, 0, -1):
+        lat_h, lng_w = cell_size_degrees(p)
+        if lat_h * METERS_PER_DEGREE >= radius_m and lng_w * meters_per_lng_degree >= radius_m:
+            precision = p
+            break
+
+    lat_h, lng_w = cell_size_degrees(precision)
+    cells = []
+    for d_lat in (-1, 0, 1):
+        for d_lng in (-1, 0, 1):
+            lat = max(min(latitude + d_lat * lat_h, 90.0), -90.0)
+            lng = (longitude + d_lng * lng_w + 180.0) % 360.0 - 180.0
+            cell = encode_geohash(lat, lng, precision)
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """prefix로 시작하는 모든 geohash보다 큰 가장 작은 문자열 (범위 검색의 상한)"""
+    chars = list(prefix)
+    while chars:
+        index = BASE32.index(chars[-1])
+        if index + 1 < len(BASE32):
+            chars[-1] = BASE32[index + 1]
+            return "".join(chars)
+        chars.pop()
+    return None
@@ -3,9 +3,12 @@ from dotenv import load_dotenv
 # .env 로드 (로컬 개발 편의성)
 load_dotenv()
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app import db
+from app.pagination import NEXT_CURSOR_HEADER
+from app.repricing import REPRICING_ENABLED, RepricingScheduler
 from app.routers import places, events, deals, docents
 
 # DB 초기화 (주의: 로컬 실행 시 AZURE_SQL_CONNECTIONSTRING 환경변수 필수)
@@ -14,11 +17,22 @@ from app.routers import places, events, deals, docents
 # db.py에서 에러가 안 났다면 엔진 생성됨
 db.Base.metadata.create_all(bind=db.engine)
 
+# 할인 재가격 스케줄러 (REPRICING_ENABLED=true일 때만 lifespan에서 시작)
+repricing_scheduler = RepricingScheduler(db.AsyncSessionLocal)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if REPRICING_ENABLED:
+        repricing_scheduler.start()
+    yield
+    await repricing_scheduler.stop()
+
 # FastAPI 앱
 app = FastAPI(
     title="UNMUTE API",
     description="Z세대를 위한 Indie Culture OS Backend",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS (배포 시에는 더 제한적으로)
@@ -28,6 +42,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # 라우터 등록
@@ -40,3 +55,13 @@ app.include_router(docents.router)
 @app.get("/health")
 async def health():
     return {"status": "ok"}
+
+# DB 커넥션 풀 상태 (워커별 풀 크기 튜닝용)
+@app.get("/health/pool")
+async def health_pool():
+    return db.pool_status()
+
+# 재가격 스케줄러 tick 통계
+@app.get("/health/repricing")
+async def health_repricing():
+    return repricing_scheduler.stats
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, Index, true, false
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db import Base
@@ -7,11 +7,23 @@ class Deal(Base):
     __tablename__ = "deals"
 
     id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(Integer, ForeignKey("events.id"))
+    event_id = Column(Integer, ForeignKey("events.id"), index=True)
     discount_rate = Column(Integer)  # 0-100
     starts_at = Column(DateTime)
     ends_at = Column(DateTime)
+    # 재가격 엔진(app/repricing.py)이 만든 딜. 이벤트당 하나만 유지하며 매 tick마다 갱신
+    is_auto = Column(Boolean, nullable=False, default=False, server_default=false())
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     event = relationship("Event", back_populates="deals")
+
+    __table_args__ = (
+        # 현재 유효한 딜 조회 (ends_at > now AND starts_at <= now) 범위 검색용
+        Index("ix_deals_active_window", "ends_at", "starts_at", "event_id"),
+        # upsert(ON CONFLICT) 대상: 이벤트당 자동 딜 1개
+        Index(
+            "uq_deals_auto_event_id", "event_id", unique=True,
+            sqlite_where=is_auto == true(), postgresql_where=is_auto == true(),
+        ),
+    )
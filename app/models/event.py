@@ -11,6 +11,7 @@ class Event(Base):
     title = Column(String(200), index=True)
     start_time = Column(DateTime)
     remaining_seats = Column(Integer)
+    total_capacity = Column(Integer, nullable=True)  # 점유율 계산용 (없으면 할인 계산 시 remaining_seats로 대체)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, delete, event, inspect, insert
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db import Base
+from app.geo import encode_geohash
 
 class Place(Base):
     __tablename__ = "places"
@@ -9,11 +10,84 @@ class Place(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), index=True)
     category = Column(String(100))
+    # "jazz,indie,live" 형태 (응답용). 태그 검색은 place_tags 테이블을 사용
     tags = Column(String(500), nullable=True)
     latitude = Column(Float)
     longitude = Column(Float)
+    # 근처 검색용 geohash (latitude/longitude에서 자동 계산, B-tree 범위 검색)
+    geohash = Column(String(12), index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     events = relationship("Event", back_populates="place")
     docents = relationship("Docent", back_populates="place")
+
+
+class PlaceTag(Base):
+    """Place.tags를 (place_id, tag) 행으로 정규화한 태그 인덱스"""
+    __tablename__ = "place_tags"
+
+    place_id = Column(Integer, ForeignKey("places.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(50), primary_key=True)
+
+    __table_args__ = (
+        # 태그 -> 장소 조회용 (PK는 장소 -> 태그 순서)
+        Index("ix_place_tags_tag_place_id", "tag", "place_id"),
+    )
+
+
+def parse_tags(tags: str | None) -> list[str]:
+    """'Jazz, indie,,jazz' -> ['jazz', 'indie'] (소문자, 공백/중복 제거, 순서 유지)"""
+    if not tags:
+        return []
+    result = []
+    for tag in tags.split(","):
+        tag = tag.strip().lower()[:50]
+        if tag and tag not in result:
+            result.append(tag)
+    return result
+
+
+@event.listens_for(Place, "before_insert")
+@event.listens_for(Place, "before_update")
+def _sync_geohash(mapper, connection, target):
+    """좌표가 바뀔 때마다 geohash를 다시 계산"""
+    if target.latitude is not None and target.longitude is not None:
+        target.geohash = encode_geohash(target.latitude, target.longitude)
+    else:
+        target.geohash = None
+
+
+@event.listens_for(Place, "before_insert")
+@event.listens_for(Place, "before_update")
+def _normalize_tags(mapper, connection, target):
+    tags = parse_tags(target.tags)
+    target.tags = ",".join(tags) if tags else None
+
+
+def _insert_tag_rows(connection, target):
+    tags = parse_tags(target.tags)
+    if tags:
+        connection.execute(
+            insert(PlaceTag.__table__),
+            [{"place_id": target.id, "tag": tag} for tag in tags],
+        )
+
+
+@event.listens_for(Place, "after_insert")
+def _create_tag_rows(mapper, connection, target):
+    _insert_tag_rows(connection, target)
+
+
+@event.listens_for(Place, "after_update")
+def _replace_tag_rows(mapper, connection, target):
+    if not inspect(target).attrs.tags.history.has_changes():
+        return
+    connection.execute(delete(PlaceTag.__table__).where(PlaceTag.place_id == target.id))
+    _insert_tag_rows(connection, target)
+
+
+@event.listens_for(Place, "before_delete")
+def _delete_tag_rows(mapper, connection, target):
+    # SQLite는 기본적으로 FK CASCADE를 적용하지 않으므로 직접 삭제
+    connection.execute(delete(PlaceTag.__table__).where(PlaceTag.place_id == target.id))
@@ -0,0 +1,78 @@
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import DateTime, Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# 목록 API 공통 keyset(cursor) 페이지네이션
+# OFFSET은 앞 페이지를 모두 읽고 버리므로 깊이 갈수록 느려진다.
+# 마지막 행의 정렬 키를 cursor로 넘기고 "키 > cursor" 조건으로 인덱스를 바로 타게 한다.
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """목록 API 공통 쿼리 파라미터 (?cursor=&limit=)"""
+
+    def __init__(
+        self,
+        cursor: str | None = Query(None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 헤더 값"),
+        limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: list) -> list:
+    """cursor 문자열을 정렬 키 값 목록으로 복원 (형식이 틀리면 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError(cursor)
+        return [
+            datetime.fromisoformat(v) if isinstance(key.type, DateTime) else v
+            for key, v in zip(keys, values)
+        ]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    keys: list,
+    page: PageParams,
+    response: Response,
+    descending: bool = False,
+) -> list:
+    """
+    keys 순서로 정렬한 한 페이지를 반환.
+    다음 페이지가 있으면 response에 X-Next-Cursor 헤더를 붙인다.
+    """
+    if page.cursor:
+        values = decode_cursor(page.cursor, keys)
+        if descending:
+            stmt = stmt.where(tuple_(*keys) < tuple_(*values))
+        else:
+            stmt = stmt.where(tuple_(*keys) > tuple_(*values))
+
+    order = [key.desc() if descending else key.asc() for key in keys]
+    # 다음 페이지 존재 여부를 알기 위해 한 행 더 읽는다
+    result = await db.execute(stmt.order_by(*order).limit(page.limit + 1))
+    rows = list(result.scalars().all())
+
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [getattr(rows[-1], key.key) for key in keys]
+        )
+    return rows
@@ -0,0 +1,49 @@
+import numpy as np
+from datetime import datetime, timedelta
+
+# 동적 할인 계산 (POST /deals/recommend, /deals/recommend/batch 공통)
+# Stub logic: discount_rate = (occupancy_rate * 20) + (minutes_to_start * 2)
+BASE_PRICE = 10000  # Stub price
+DEAL_TTL = timedelta(minutes=15)
+
+
+def recommend_discount(remaining_seats: int, minutes_to_start: int, total_capacity: int) -> tuple[int, int]:
+    """한 이벤트의 (discount_rate, discounted_price)"""
+    if total_capacity == 0:
+        occupancy_rate = 1
+    else:
+        occupancy_rate = (total_capacity - remaining_seats) / total_capacity
+
+    # minutes_to_start * 2 logic seems weird if it increases discount as time remains more?
+    # Usually less time = more discount. But prompt says "minutes_to_start * 2".
+    # I will follow prompt example exactly.
+    raw_discount = (occupancy_rate * 20) + (minutes_to_start * 2)
+    discount_rate = min(int(raw_discount), 100)
+    discounted_price = int(BASE_PRICE * (100 - discount_rate) / 100)
+    return discount_rate, discounted_price
+
+
+def recommend_discounts(
+    remaining_seats: np.ndarray,
+    minutes_to_start: np.ndarray,
+    total_capacity: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    recommend_discount의 벡터 버전. 여러 이벤트를 배열 연산 한 번으로 계산한다.
+    (연산 순서를 스칼라 버전과 맞춰서 결과가 정수 단위까지 같다)
+    """
+    remaining = remaining_seats.astype(np.float64)
+    capacity = total_capacity.astype(np.float64)
+    minutes = minutes_to_start.astype(np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        occupancy_rate = np.where(capacity == 0, 1.0, (capacity - remaining) / capacity)
+
+    raw_discount = (occupancy_rate * 20) + (minutes * 2)
+    discount_rate = np.minimum(np.trunc(raw_discount), 100).astype(np.int64)
+    discounted_price = np.trunc(BASE_PRICE * (100 - discount_rate) / 100).astype(np.int64)
+    return discount_rate, discounted_price
+
+
+def deal_expires_at(now: datetime | None = None) -> datetime:
+    return (now or datetime.utcnow()) + DEAL_TTL
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import select, true
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db import dialect_insert
+from app.models.deal import Deal
+from app.models.event import Event
+from app.pricing import recommend_discounts
+
+logger = logging.getLogger(__name__)
+
+# 백그라운드 재가격 엔진
+# 곧 시작하는 이벤트의 할인율을 주기적으로 한꺼번에 계산해 deals 테이블에 미리 써 둔다.
+# (읽기 쪽은 /deals/active 등으로 계산 없이 조회)
+REPRICING_ENABLED = os.getenv("REPRICING_ENABLED", "false").lower() in ("1", "true", "yes", "on")
+REPRICING_INTERVAL_SECONDS = float(os.getenv("REPRICING_INTERVAL_SECONDS", "60"))
+REPRICING_WINDOW_MINUTES = int(os.getenv("REPRICING_WINDOW_MINUTES", "180"))
+# 한 INSERT 문에 넣는 행 수 (SQLite 바인드 변수 한도 고려)
+UPSERT_CHUNK_SIZE = 2000
+
+
+async def reprice_once(
+    db: AsyncSession,
+    now: datetime | None = None,
+    window: timedelta = timedelta(minutes=REPRICING_WINDOW_MINUTES),
+) -> dict:
+    """
+    now ~ now + window 사이에 시작하는 이벤트의 자동 딜을 upsert.
+    할인율이 0 이하인 이벤트는 건너뛴다.
+    """
+    now = now or datetime.utcnow()
+    result = await db.execute(
+        select(Event.id, Event.remaining_seats, Event.start_time, Event.total_capacity)
+        .where(Event.start_time > now, Event.start_time <= now + window)
+    )
+    events = result.all()
+    if not events:
+        return {"events": 0, "upserted": 0}
+
+    remaining = np.array([e.remaining_seats or 0 for e in events], dtype=np.int64)
+    capacity = np.array(
+        [e.total_capacity if e.total_capacity is not None else (e.remaining_seats or 0) for e in events],
+        dtype=np.int64,
+    )
+    start_times = np.array([e.start_time for e in events], dtype="datetime64[us]")
+    minutes = (start_times - np.datetime64(now, "us")) // np.timedelta64(1, "m")
+    rates, _ = recommend_discounts(remaining, minutes, capacity)
+
+    rows = [
+        {
+            "event_id": e.id,
+            "discount_rate": rate,
+            "starts_at": now,
+            "ends_at": e.start_time,
+            "is_auto": True,
+            "created_at": now,
+        }
+        for e, rate in zip(events, rates.tolist())
+        if rate > 0
+    ]
+
+    insert = dialect_insert(db.get_bind().dialect.name)
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = insert(Deal).values(rows[start:start + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Deal.event_id],
+            index_where=Deal.is_auto == true(),
+            set_={
+                "discount_rate": stmt.excluded.discount_rate,
+                "starts_at": stmt.excluded.starts_at,
+                "ends_at": stmt.excluded.ends_at,
+            },
+        )
+        await db.execute(stmt)
+    await db.commit()
+    return {"events": len(events), "upserted": len(rows)}
+
+
+class RepricingScheduler:
+    """FastAPI lifespan에서 도는 in-process 스케줄러 (tick마다 reprice_once 실행)"""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        interval_seconds: float = REPRICING_INTERVAL_SECONDS,
+        window: timedelta = timedelta(minutes=REPRICING_WINDOW_MINUTES),
+    ):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.window = window
+        self._task: asyncio.Task | None = None
+        self.stats = {
+            "running": False,
+            "ticks": 0,
+            "errors": 0,
+            "last_tick_at": None,
+            "last_tick_ms": None,
+            "max_tick_ms": 0.0,
+            "last_events": 0,
+            "last_upserted": 0,
+            "total_upserted": 0,
+            "last_error": None,
+        }
+
+    async def tick(self) -> dict:
+        started = time.perf_counter()
+        async with self.session_factory() as db:
+            result = await reprice_once(db, window=self.window)
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        self.stats.update(
+            ticks=self.stats["ticks"] + 1,
+            last_tick_at=datetime.utcnow().isoformat(),
+            last_tick_ms=elapsed_ms,
+            max_tick_ms=max(self.stats["max_tick_ms"], elapsed_ms),
+            last_events=result["events"],
+            last_upserted=result["upserted"],
+            total_upserted=self.stats["total_upserted"] + result["upserted"],
+        )
+        logger.info("repricing tick: %s events, %s deals in %.1f ms", result["events"], result["upserted"], elapsed_ms)
+        return result
+
+    async def _run(self):
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:  # 한 번 실패해도 다음 tick은 계속
+                self.stats["errors"] += 1
+                self.stats["last_error"] = repr(e)
+                logger.exception("repricing tick failed")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            self.stats["running"] = True
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self.stats["running"] = False
@@ -1,10 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
 from app.db import get_db
+from app.pagination import PageParams, paginate
 from app.models.deal import Deal
-from app.schemas.deal import DealCreate, DealResponse
-from pydantic import BaseModel
-from datetime import datetime, timedelta
+from app.models.event import Event
+from app.schemas.deal import DealCreate, DealResponse, ActiveDealResponse
+from app.pricing import deal_expires_at, recommend_discount, recommend_discounts
+from pydantic import BaseModel, Field, model_validator
+from datetime import datetime
+
+MAX_RECOMMEND_BATCH = 50_000
 
 router = APIRouter(prefix="/deals", tags=["deals"])
 
@@ -13,10 +22,54 @@ router = APIRouter(prefix="/deals", tags=["deals"])
     summary="List all deals",
     response_model=list[DealResponse]
 )
-async def list_deals(db: Session = Depends(get_db)):
+async def list_deals(
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
     # TODO
-    ''' deal을 list 형태로 반환'''
-    return db.query(Deal).all() # db.query()를 통해 Deal에 있는 모든 데이터들을 가져온다.
+    ''' deal을 최신순(id 내림차순)으로 한 페이지씩 반환. 다음 페이지는 X-Next-Cursor 헤더.'''
+    return await paginate(db, select(Deal), [Deal.id], page, response, descending=True)
+
+@router.get(
+    "/active",
+    summary="List currently valid deals",
+    response_model=list[ActiveDealResponse]
+)
+async def list_active_deals(
+    response: Response,
+    at: datetime | None = Query(None, description="기준 시각 (기본: 현재 UTC)"),
+    event_id: int | None = None,
+    place_id: int | None = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    '''
+    at 시점에 유효한(starts_at <= at < ends_at) deal을 마감 임박순으로 반환.
+    이벤트 시작 시간/잔여 좌석을 같은 JOIN 쿼리로 함께 가져온다.
+    '''
+    at = at or datetime.utcnow()
+    stmt = (
+        select(Deal)
+        .join(Deal.event)
+        .options(contains_eager(Deal.event))
+        .where(Deal.ends_at > at, Deal.starts_at <= at)
+    )
+    if event_id is not None:
+        stmt = stmt.where(Deal.event_id == event_id)
+    if place_id is not None:
+        stmt = stmt.where(Event.place_id == place_id)
+
+    deals = await paginate(db, stmt, [Deal.ends_at, Deal.id], page, response)
+    return [
+        ActiveDealResponse(
+            **DealResponse.model_validate(deal).model_dump(),
+            place_id=deal.event.place_id,
+            event_start_time=deal.event.start_time,
+            remaining_seats=deal.event.remaining_seats,
+        )
+        for deal in deals
+    ]
 
 @router.post(
     "/",
@@ -24,15 +77,15 @@ async def list_deals(db: Session = Depends(get_db)):
     response_model=DealResponse,
     status_code=status.HTTP_201_CREATED
 )
-async def create_deal(deal: DealCreate, db: Session = Depends(get_db)):
+async def create_deal(deal: DealCreate, db: AsyncSession = Depends(get_db)):
     # TODO
     '''
     deal을 생성.
     '''
-    new_deal = Deal(**deal.dict()) # deal를 처리할 수 있는 형태로.
+    new_deal = Deal(**deal.model_dump()) # deal를 처리할 수 있는 형태로.
     db.add(new_deal) # DB 세션에 추가.
-    db.commit() # 변경사항 저장.
-    db.refresh(new_deal) # 갱신
+    await db.commit() # 변경사항 저장.
+    await db.refresh(new_deal) # 갱신
 
     return new_deal
 
@@ -41,12 +94,12 @@ async def create_deal(deal: DealCreate, db: Session = Depends(get_db)):
     summary="Get a deal",
     response_model=DealResponse
 )
-async def get_deal(deal_id: int, db: Session = Depends(get_db)):
+async def get_deal(deal_id: int, db: AsyncSession = Depends(get_db)):
     # TODO
     '''
     해당되는 deal을 반환.
     '''
-    deal = db.query(Deal).filter(Deal.id == deal_id).first() # deal_id인 멤버를 DB에서 찾기.
+    deal = await db.get(Deal, deal_id) # deal_id인 멤버를 DB에서 찾기.
 
     if deal is None:
         raise HTTPException(status_code=404, detail="Deal not found")
@@ -59,18 +112,18 @@ async def get_deal(deal_id: int, db: Session = Depends(get_db)):
     summary="Delete a deal",
     status_code=status.HTTP_204_NO_CONTENT
 )
-async def delete_deal(deal_id: int, db: Session = Depends(get_db)):
+async def delete_deal(deal_id: int, db: AsyncSession = Depends(get_db)):
     # TODO
     '''
     deal을 삭제.
     '''
-    deal = db.query(Deal).filter(Deal.id == deal_id).first()
+    deal = await db.get(Deal, deal_id)
 
     if deal is None:
         raise HTTPException(status_code=404, detail="Deal not found")
 
-    db.delete(deal)
-    db.commit()
+    await db.delete(deal)
+    await db.commit()
 
 # Special endpoint: Recommend Deal
 class DealRecommendInput(BaseModel):
@@ -94,28 +147,73 @@ async def recommend_deal(input: DealRecommendInput):
     Calculate dynamic discount rate based on occupancy and time left.
     Stub logic: discount_rate = (occupancy_rate * 20) + (minutes_to_start * 2)
     """
-    if input.total_capacity == 0:
-        occupancy_rate = 1
-    else:
-        occupancy_rate = (input.total_capacity - input.remaining_seats) / input.total_capacity
-    
-    # Simple stub calculation
-    # minutes_to_start * 2 logic seems weird if it increases discount as time remains more?
-    # Usually less time = more discount. But prompt says "minutes_to_start * 2".
-    # I will follow prompt example exactly.
-    # Prompt: discount_rate = (occupancy_rate * 20) + (minutes_to_start * 2)
-    
-    raw_discount = (occupancy_rate * 20) + (input.minutes_to_start * 2)
-    discount_rate = min(int(raw_discount), 100)
-    
-    # Stub price (e.g. base 10000)
-    base_price = 10000
-    discounted_price = int(base_price * (100 - discount_rate) / 100)
-    
-    expires_at = datetime.utcnow() + timedelta(minutes=15)
-    
+    discount_rate, discounted_price = recommend_discount(
+        input.remaining_seats, input.minutes_to_start, input.total_capacity
+    )
+
     return {
         "discount_rate": discount_rate,
         "discounted_price": discounted_price,
-        "expires_at": expires_at
+        "expires_at": deal_expires_at()
     }
+
+class DealRecommendBatchInput(BaseModel):
+    rows: list[DealRecommendInput] | None = Field(None, max_length=MAX_RECOMMEND_BATCH)
+    event_ids: list[int] | None = Field(None, max_length=MAX_RECOMMEND_BATCH)
+
+    @model_validator(mode="after")
+    def check_one_source(self):
+        if (self.rows is None) == (self.event_ids is None):
+            raise ValueError("Provide exactly one of rows or event_ids")
+        return self
+
+@router.post(
+    "/recommend/batch",
+    summary="Recommend dynamic discounts for many events",
+    description="Streams one NDJSON line per event: event_id, discount_rate, discounted_price, expires_at",
+    response_class=StreamingResponse
+)
+async def recommend_deals_batch(input: DealRecommendBatchInput, db: AsyncSession = Depends(get_db)):
+    """
+    rows를 그대로 쓰거나, event_ids면 DB에서 잔여 좌석/시작 시간/정원을 한 번에 읽어
+    NumPy 배열 연산 한 번으로 전체 할인율을 계산한다.
+    """
+    now = datetime.utcnow()
+
+    if input.rows is not None:
+        event_ids = np.array([r.event_id for r in input.rows], dtype=np.int64)
+        remaining = np.array([r.remaining_seats for r in input.rows], dtype=np.int64)
+        minutes = np.array([r.minutes_to_start for r in input.rows], dtype=np.int64)
+        capacity = np.array([r.total_capacity for r in input.rows], dtype=np.int64)
+    else:
+        result = await db.execute(
+            select(Event.id, Event.remaining_seats, Event.start_time, Event.total_capacity)
+            .where(Event.id.in_(input.event_ids))
+        )
+        events = result.all()
+        event_ids = np.array([e.id for e in events], dtype=np.int64)
+        remaining = np.array([e.remaining_seats or 0 for e in events], dtype=np.int64)
+        # 정원 정보가 없으면 잔여 좌석을 정원으로 간주 (점유율 0)
+        capacity = np.array(
+            [e.total_capacity if e.total_capacity is not None else (e.remaining_seats or 0) for e in events],
+            dtype=np.int64,
+        )
+        start_times = np.array([e.start_time for e in events], dtype="datetime64[us]")
+        minutes = np.maximum((start_times - np.datetime64(now, "us")) // np.timedelta64(1, "m"), 0)
+
+    rates, prices = recommend_discounts(remaining, minutes, capacity)
+    expires_at = deal_expires_at(now).isoformat()
+
+    def ndjson_lines(chunk_size: int = 1000):
+        ids, rate_list, price_list = event_ids.tolist(), rates.tolist(), prices.tolist()
+        for start in range(0, len(ids), chunk_size):
+            yield "".join(
+                f'{{"event_id":{e},"discount_rate":{r},"discounted_price":{p},"expires_at":"{expires_at}"}}\n'
+                for e, r, p in zip(
+                    ids[start:start + chunk_size],
+                    rate_list[start:start + chunk_size],
+                    price_list[start:start + chunk_size],
+                )
+            )
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import get_db
+from app.pagination import PageParams, paginate
 from app.models.docent import Docent
 from app.schemas.docent import DocentCreate, DocentResponse
 from pydantic import BaseModel
@@ -12,13 +14,17 @@ router = APIRouter(prefix="/docents", tags=["docents"])
     summary="List all docents",
     response_model=list[DocentResponse]
 )
-async def list_docents(db: Session = Depends(get_db)):
+async def list_docents(
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
     # TODO
     '''
-    docents를 리스트 형태로 반환.
+    docents를 최신순으로 한 페이지씩 반환. 다음 페이지는 X-Next-Cursor 헤더.
     '''
 
-    return db.query(Docent).all()
+    return await paginate(db, select(Docent), [Docent.id], page, response, descending=True)
 
 @router.post(
     "/",
@@ -26,17 +32,17 @@ async def list_docents(db: Session = Depends(get_db)):
     response_model=DocentResponse,
     status_code=status.HTTP_201_CREATED
 )
-async def create_docent(docent: DocentCreate, db: Session = Depends(get_db)):
+async def create_docent(docent: DocentCreate, db: AsyncSession = Depends(get_db)):
     # TODO
 
     '''
     docent 생성.
     '''
 
-    new_docent = Docent(**docent.dict())
+    new_docent = Docent(**docent.model_dump())
     db.add(new_docent)
-    db.commit()
-    db.refresh(new_docent)
+    await db.commit()
+    await db.refresh(new_docent)
 
     return new_docent
 
@@ -45,11 +51,11 @@ async def create_docent(docent: DocentCreate, db: Session = Depends(get_db)):
     summary="Get a docent",
     response_model=DocentResponse
 )
-async def get_docent(docent_id: int, db: Session = Depends(get_db)):
+async def get_docent(docent_id: int, db: AsyncSession = Depends(get_db)):
     # TODO
     '''해당되는 docent를 반환'''
 
-    docent = db.query(Docent).filter(Docent.id == docent_id).first()
+    docent = await db.get(Docent, docent_id)
 
     if docent is None:
         raise HTTPException(status_code=404, detail="Docent Not Found")
@@ -61,18 +67,18 @@ async def get_docent(docent_id: int, db: Session = Depends(get_db)):
     summary="Delete a docent",
     status_code=status.HTTP_204_NO_CONTENT
 )
-async def delete_docent(docent_id: int, db: Session = Depends(get_db)):
+async def delete_docent(docent_id: int, db: AsyncSession = Depends(get_db)):
     # TODO
     '''
     해당되는 docent를 삭제.
     '''
-    docent = db.query(Docent).filter(Docent.id == docent_id).first()
+    docent = await db.get(Docent, docent_id)
 
     if docent is None:
         raise HTTPException(status_code=404,detail="Docent Not Found")
 
-    db.delete(docent)
-    db.commit()
+    await db.delete(docent)
+    await db.commit()
 
 # Special endpoint: Generate Docent Content
 class DocentGenerateInput(BaseModel):
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import get_db
+from app.pagination import PageParams, paginate
 from app.models.event import Event
-from app.schemas.event import EventCreate, EventUpdate, EventResponse
+from app.schemas.event import EventCreate, EventUpdate, EventResponse, SeatReservationCreate, SeatReservationResponse
 
 router = APIRouter(prefix="/events", tags=["events"])
 
@@ -11,9 +13,13 @@ router = APIRouter(prefix="/events", tags=["events"])
     summary="List all events",
     response_model=list[EventResponse]
 )
-async def list_events(db: Session = Depends(get_db)):
-    # TODO
-    return []
+async def list_events(
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    # 최신순, 다음 페이지는 X-Next-Cursor 헤더
+    return await paginate(db, select(Event), [Event.id], page, response, descending=True)
 
 @router.post(
     "/",
@@ -21,36 +27,83 @@ async def list_events(db: Session = Depends(get_db)):
     response_model=EventResponse,
     status_code=status.HTTP_201_CREATED
 )
-async def create_event(event: EventCreate, db: Session = Depends(get_db)):
-    # TODO
-    raise NotImplementedError("TODO")
+async def create_event(event: EventCreate, db: AsyncSession = Depends(get_db)):
+    new_event = Event(**event.model_dump())
+    db.add(new_event)
+    await db.commit()
+    await db.refresh(new_event)
+    return new_event
 
 @router.get(
     "/{event_id}",
     summary="Get an event",
     response_model=EventResponse
 )
-async def get_event(event_id: int, db: Session = Depends(get_db)):
-    # TODO
-    raise NotImplementedError("TODO")
+async def get_event(event_id: int, db: AsyncSession = Depends(get_db)):
+    db_event = await db.get(Event, event_id)
+    if db_event is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return db_event
 
 @router.patch(
     "/{event_id}",
     summary="Update an event",
     response_model=EventResponse
 )
-async def update_event(event_id: int, event: EventUpdate, db: Session = Depends(get_db)):
-    # TODO
-    raise NotImplementedError("TODO")
+async def update_event(event_id: int, event: EventUpdate, db: AsyncSession = Depends(get_db)):
+    db_event = await db.get(Event, event_id)
+    if db_event is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    # 보낸 필드만 수정
+    for field, value in event.model_dump(exclude_unset=True).items():
+        setattr(db_event, field, value)
+    await db.commit()
+    await db.refresh(db_event)
+    return db_event
 
 @router.delete(
     "/{event_id}",
     summary="Delete an event",
     status_code=status.HTTP_204_NO_CONTENT
 )
-async def delete_event(event_id: int, db: Session = Depends(get_db)):
-    # TODO
-    raise NotImplementedError("TODO")
+async def delete_event(event_id: int, db: AsyncSession = Depends(get_db)):
+    db_event = await db.get(Event, event_id)
+    if db_event is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    await db.delete(db_event)
+    await db.commit()
+
+@router.post(
+    "/{event_id}/reserve",
+    summary="Reserve seats atomically",
+    response_model=SeatReservationResponse,
+    responses={404: {"description": "Event not found"}, 409: {"description": "Not enough seats"}}
+)
+async def reserve_seats(event_id: int, reservation: SeatReservationCreate, db: AsyncSession = Depends(get_db)):
+    """
+    조건부 UPDATE 한 번으로 좌석을 차감한다 (읽고-수정-쓰기 없음).
+    remaining_seats >= seats일 때만 행이 바뀌므로 동시에 몰려도 초과 판매가 없고,
+    행 잠금은 UPDATE ~ COMMIT 동안만 잡힌다.
+    """
+    stmt = (
+        update(Event)
+        .where(Event.id == event_id, Event.remaining_seats >= reservation.seats)
+        .values(remaining_seats=Event.remaining_seats - reservation.seats)
+        .returning(Event.remaining_seats)
+        .execution_options(synchronize_session=False)
+    )
+    remaining = (await db.execute(stmt)).scalar_one_or_none()
+
+    if remaining is None:
+        await db.rollback()
+        if await db.get(Event, event_id) is None:
+            raise HTTPException(status_code=404, detail="Event not found")
+        raise HTTPException(status_code=409, detail="Not enough seats")
+
+    await db.commit()
+    return {"event_id": event_id, "reserved": reservation.seats, "remaining_seats": remaining}
 
 # Special endpoint: Get events by place
 @router.get(
@@ -81,7 +134,7 @@ async def delete_event(event_id: int, db: Session = Depends(get_db)):
                      
     response_model=list[EventResponse]
 )
-async def list_events_by_place(place_id: int, db: Session = Depends(get_db)):
+async def list_events_by_place(place_id: int, db: AsyncSession = Depends(get_db)):
     # TODO
     return []
 # Wait, if I want it to be /places/{place_id}/events, and keeping it in events.py:
@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import get_db
-from app.models.place import Place
-from app.schemas.place import PlaceCreate, PlaceUpdate, PlaceResponse
+from app.geo import cover_cells, haversine_m, prefix_upper_bound
+from app.pagination import PageParams, paginate
+from app.models.place import Place, PlaceTag, parse_tags
+from app.schemas.place import PlaceCreate, PlaceUpdate, PlaceResponse, NearbyPlaceResponse
 
 router = APIRouter(prefix="/places", tags=["places"])
 
@@ -13,10 +17,61 @@ router = APIRouter(prefix="/places", tags=["places"])
     response_model=list[PlaceResponse],
     status_code=status.HTTP_200_OK
 )
-async def list_places(db: Session = Depends(get_db)):
-    """Get all places."""
-    # TODO: Query DB and return list
-    return []
+async def list_places(
+    response: Response,
+    tags: str | None = Query(None, description="Comma separated tags, e.g. indie,jazz"),
+    match: Literal["any", "all"] = Query("any", description="any: at least one tag, all: every tag"),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get places, newest first. Next page cursor is in the X-Next-Cursor header."""
+    stmt = select(Place)
+
+    tag_list = parse_tags(tags)
+    if tag_list:
+        # place_tags의 (tag, place_id) 인덱스로 후보 place_id를 찾는다
+        matched = select(PlaceTag.place_id).where(PlaceTag.tag.in_(tag_list))
+        if match == "all":
+            matched = matched.group_by(PlaceTag.place_id).having(func.count() == len(tag_list))
+        stmt = stmt.where(Place.id.in_(matched))
+
+    return await paginate(db, stmt, [Place.id], page, response, descending=True)
+
+@router.get(
+    "/nearby",
+    summary="Find places near a point",
+    description="Distance-sorted places within radius_m, using the geohash index",
+    response_model=list[NearbyPlaceResponse]
+)
+async def list_nearby_places(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    radius_m: float = Query(1000, gt=0, le=50_000),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    """Scan only the geohash cells covering the circle, then sort candidates by distance."""
+    ranges = []
+    for cell in cover_cells(lat, lng, radius_m):
+        upper = prefix_upper_bound(cell)
+        if upper is None:
+            ranges.append(Place.geohash >= cell)
+        else:
+            ranges.append(and_(Place.geohash >= cell, Place.geohash < upper))
+
+    result = await db.execute(select(Place).where(or_(*ranges)))
+
+    nearby = []
+    for place in result.scalars():
+        distance = haversine_m(lat, lng, place.latitude, place.longitude)
+        if distance <= radius_m:
+            nearby.append((distance, place))
+    nearby.sort(key=lambda item: item[0])
+
+    return [
+        NearbyPlaceResponse(**PlaceResponse.model_validate(place).model_dump(), distance_m=round(distance, 1))
+        for distance, place in nearby[:limit]
+    ]
 
 @router.post(
     "/",
@@ -24,34 +79,51 @@ async def list_places(db: Session = Depends(get_db)):
     response_model=PlaceResponse,
     status_code=status.HTTP_201_CREATED
 )
-async def create_place(place: PlaceCreate, db: Session = Depends(get_db)):
+async def create_place(place: PlaceCreate, db: AsyncSession = Depends(get_db)):
     """Create a new place."""
-    # TODO: Create and save to DB
-    raise NotImplementedError("TODO: Implement place creation")
+    new_place = Place(**place.model_dump())
+    db.add(new_place)
+    await db.commit()
+    await db.refresh(new_place)
+    return new_place
 
 @router.get(
     "/{place_id}",
     summary="Get a place by ID",
     response_model=PlaceResponse
 )
-async def get_place(place_id: int, db: Session = Depends(get_db)):
-    # TODO
-    raise NotImplementedError("TODO: Implement get place")
+async def get_place(place_id: int, db: AsyncSession = Depends(get_db)):
+    place = await db.get(Place, place_id)
+    if place is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+    return place
 
 @router.patch(
     "/{place_id}",
     summary="Update a place",
     response_model=PlaceResponse
 )
-async def update_place(place_id: int, place: PlaceUpdate, db: Session = Depends(get_db)):
-    # TODO
-    raise NotImplementedError("TODO: Implement update place")
+async def update_place(place_id: int, place: PlaceUpdate, db: AsyncSession = Depends(get_db)):
+    db_place = await db.get(Place, place_id)
+    if db_place is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+
+    # 보낸 필드만 수정 (geohash는 좌표 변경 시 모델 이벤트에서 다시 계산)
+    for field, value in place.model_dump(exclude_unset=True).items():
+        setattr(db_place, field, value)
+    await db.commit()
+    await db.refresh(db_place)
+    return db_place
 
 @router.delete(
     "/{place_id}",
     summary="Delete a place",
     status_code=status.HTTP_204_NO_CONTENT
 )
-async def delete_place(place_id: int, db: Session = Depends(get_db)):
-    # TODO
-    raise NotImplementedError("TODO: Implement delete place")
+async def delete_place(place_id: int, db: AsyncSession = Depends(get_db)):
+    place = await db.get(Place, place_id)
+    if place is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+
+    await db.delete(place)
+    await db.commit()
@@ -13,7 +13,13 @@ class DealResponse(BaseModel):
     discount_rate: int
     starts_at: datetime
     ends_at: datetime
+    is_auto: bool = False
     created_at: datetime
 
     class Config:
         from_attributes = True
+
+class ActiveDealResponse(DealResponse):
+    place_id: int
+    event_start_time: datetime
+    remaining_seats: int
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 class EventCreate(BaseModel):
@@ -6,11 +6,13 @@ class EventCreate(BaseModel):
     title: str
     start_time: datetime
     remaining_seats: int
+    total_capacity: int | None = None
 
 class EventUpdate(BaseModel):
     title: str | None = None
     start_time: datetime | None = None
     remaining_seats: int | None = None
+    total_capacity: int | None = None
 
 class EventResponse(BaseModel):
     id: int
@@ -18,7 +20,16 @@ class EventResponse(BaseModel):
     title: str
     start_time: datetime
     remaining_seats: int
+    total_capacity: int | None = None
     created_at: datetime
 
     class Config:
         from_attributes = True
+
+class SeatReservationCreate(BaseModel):
+    seats: int = Field(1, ge=1, le=100)
+
+class SeatReservationResponse(BaseModel):
+    event_id: int
+    reserved: int
+    remaining_seats: int
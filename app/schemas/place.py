@@ -26,3 +26,6 @@ class PlaceResponse(BaseModel):
 
     class Config:
         from_attributes = True  # SQLAlchemy 호환성
+
+class NearbyPlaceResponse(PlaceResponse):
+    distance_m: float
@@ -0,0 +1,84 @@
+"""
+POST /deals/recommend (스칼라) vs /deals/recommend/batch (NumPy) 처리량 비교.
+
+사용법: python -m benchmarks.bench_recommend --rows 20000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+# app import 전에 임시 SQLite DB 지정 (실제 DB에 연결하지 않음)
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.gettempdir()}/unmute_bench.db")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.pricing import recommend_discount, recommend_discounts  # noqa: E402
+
+
+def make_rows(n: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        capacity = rng.randint(0, 300)
+        rows.append({
+            "event_id": i + 1,
+            "remaining_seats": rng.randint(0, capacity) if capacity else 0,
+            "minutes_to_start": rng.randint(0, 180),
+            "total_capacity": capacity,
+        })
+    return rows
+
+
+def report(label: str, n: int, seconds: float):
+    print(f"{label:<28} {n:>8} rows  {seconds * 1000:>10.1f} ms  {n / seconds:>14,.0f} rows/s")
+
+
+def bench_functions(rows: list[dict]):
+    started = time.perf_counter()
+    for r in rows:
+        recommend_discount(r["remaining_seats"], r["minutes_to_start"], r["total_capacity"])
+    report("scalar function", len(rows), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    recommend_discounts(
+        np.array([r["remaining_seats"] for r in rows]),
+        np.array([r["minutes_to_start"] for r in rows]),
+        np.array([r["total_capacity"] for r in rows]),
+    )
+    report("vectorized function", len(rows), time.perf_counter() - started)
+
+
+def bench_http(client: TestClient, rows: list[dict], scalar_rows: int):
+    # 스칼라 경로는 요청 1건당 1행이므로 일부만 측정해서 비교
+    sample = rows[:scalar_rows]
+    started = time.perf_counter()
+    for r in sample:
+        client.post("/deals/recommend", json=r).raise_for_status()
+    report("HTTP /recommend (1 per req)", len(sample), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    response = client.post("/deals/recommend/batch", json={"rows": rows})
+    response.raise_for_status()
+    lines = response.text.count("\n")
+    report("HTTP /recommend/batch", lines, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--scalar-http-rows", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.seed)
+    bench_functions(rows)
+    bench_http(TestClient(app), rows, args.scalar_http_rows)
+
+
+if __name__ == "__main__":
+    main()
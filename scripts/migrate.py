@@ -0,0 +1,151 @@
+"""
+스키마 마이그레이션.
+
+create_all은 없는 테이블만 만들고 기존 테이블에 컬럼/인덱스를 추가하지 않으므로,
+이미 운영 중인 DB는 이 스크립트로 맞춘다. 모든 단계는 여러 번 실행해도 안전하다.
+
+사용법: python -m scripts.migrate
+"""
+from sqlalchemy import bindparam, insert, inspect, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.expression import ClauseElement, ColumnClause
+
+from app.db import Base, engine
+from app.geo import encode_geohash
+from app.models import deal, docent, event, place  # noqa: F401 (Base에 테이블 등록)
+from app.models.deal import Deal
+from app.models.event import Event
+from app.models.place import Place, PlaceTag, parse_tags
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def ensure_column(conn: Connection, table, column_name: str):
+    """모델에는 있고 DB에는 없는 컬럼을 ALTER TABLE로 추가"""
+    existing = {c["name"] for c in inspect(conn).get_columns(table.name)}
+    if column_name in existing:
+        return
+    column = table.c[column_name]
+    ddl = f"ALTER TABLE {table.name} ADD COLUMN {column_name} {column.type.compile(dialect=conn.dialect)}"
+    if column.server_default is not None:
+        # NOT NULL 컬럼은 기존 행을 채울 기본값이 있어야 추가 가능
+        default = column.server_default.arg.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+        ddl += f" DEFAULT {default}"
+        if not column.nullable:
+            ddl += " NOT NULL"
+    conn.exec_driver_sql(ddl)
+    print(f"  + {table.name}.{column_name}")
+
+
+def ensure_indexes(conn: Connection, table):
+    """모델에 선언된 인덱스 중 없는 것 생성 (아직 추가되지 않은 컬럼의 인덱스는 이후 단계에서 생성)"""
+    existing = {c["name"] for c in inspect(conn).get_columns(table.name)}
+    for index in table.indexes:
+        if _index_column_names(index) <= existing:
+            index.create(conn, checkfirst=True)
+
+
+def _index_column_names(index) -> set[str]:
+    """인덱스 컬럼 + 부분 인덱스 WHERE 절에서 참조하는 컬럼"""
+    names = {c.name for c in index.columns}
+    for value in index.dialect_kwargs.values():
+        if isinstance(value, ClauseElement):
+            names.update(c.name for c in visitors.iterate(value) if isinstance(c, ColumnClause))
+    return names
+
+
+def migrate_place_geohash(conn: Connection):
+    """places.geohash 추가 + 기존 행 backfill"""
+    table = Place.__table__
+    ensure_column(conn, table, "geohash")
+    ensure_indexes(conn, table)
+
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("_id"))
+        .values(geohash=bindparam("_geohash"))
+    )
+    while True:
+        rows = conn.execute(
+            select(table.c.id, table.c.latitude, table.c.longitude)
+            .where(table.c.geohash.is_(None))
+            .where(table.c.latitude.is_not(None), table.c.longitude.is_not(None))
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(stmt, [
+            {"_id": row.id, "_geohash": encode_geohash(row.latitude, row.longitude)}
+            for row in rows
+        ])
+        print(f"  ~ places.geohash backfilled {len(rows)} rows")
+
+
+def migrate_place_tags(conn: Connection):
+    """places.tags 문자열을 place_tags 행으로 옮김 (아직 태그 행이 없는 장소만)"""
+    places = Place.__table__
+    tag_rows = PlaceTag.__table__
+    ensure_indexes(conn, tag_rows)
+
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(places.c.id, places.c.tags)
+            .where(places.c.id > last_id, places.c.tags.is_not(None))
+            .where(places.c.id.not_in(select(tag_rows.c.place_id)))
+            .order_by(places.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        values = [
+            {"place_id": row.id, "tag": tag}
+            for row in rows
+            for tag in parse_tags(row.tags)
+        ]
+        if values:
+            conn.execute(insert(tag_rows), values)
+        print(f"  ~ place_tags backfilled {len(values)} rows")
+
+
+def migrate_deal_indexes(conn: Connection):
+    """deals.event_id, (ends_at, starts_at, event_id) 인덱스"""
+    ensure_indexes(conn, Deal.__table__)
+
+
+def migrate_event_capacity(conn: Connection):
+    """events.total_capacity 추가 (기존 행은 NULL = 정원 미상)"""
+    ensure_column(conn, Event.__table__, "total_capacity")
+
+
+def migrate_deal_is_auto(conn: Connection):
+    """deals.is_auto (재가격 엔진이 만든 딜 표시) + 이벤트당 자동 딜 1개 unique 인덱스"""
+    ensure_column(conn, Deal.__table__, "is_auto")
+    ensure_indexes(conn, Deal.__table__)
+
+
+# 순서대로 실행되는 마이그레이션 단계
+MIGRATIONS = [
+    migrate_place_geohash,
+    migrate_place_tags,
+    migrate_deal_indexes,
+    migrate_event_capacity,
+    migrate_deal_is_auto,
+]
+
+
+def migrate():
+    # 새 테이블 생성
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        for step in MIGRATIONS:
+            print(f"- {step.__name__}")
+            step(conn)
+    print("Migration complete.")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -7,7 +7,7 @@ import sys
 os.environ.setdefault("DATABASE_URL", "sqlite:///./test_dummy.db")
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 # 2. Base 및 모델 Import
 from app.db import Base, get_db
@@ -33,18 +33,25 @@ engine = create_engine(
     connect_args={"check_same_thread": False} 
 )
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 라우터는 AsyncSession을 쓰므로 같은 파일을 aiosqlite로 연다.
+async_engine = create_async_engine(
+    "sqlite+aiosqlite:///./test.db",
+    connect_args={"check_same_thread": False}
+)
+
+TestingSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 # 4. 테스트 시작 전 테이블 생성
 # MagicMock을 지웠으므로 이제 이 코드가 정상 작동하여 'deals', 'docents' 테이블을 만듭니다.
+# 이전 실행에서 남은 test.db의 스키마가 모델과 다를 수 있으므로 매번 새로 만듭니다.
+Base.metadata.drop_all(bind=engine)
 Base.metadata.create_all(bind=engine)
 
-def override_get_db():
-    db = TestingSessionLocal()
-    try:
+async def override_get_db():
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 app.dependency_overrides[get_db] = override_get_db
 
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timedelta
 
 def test_deal_lifecycle(client):
@@ -41,3 +42,107 @@ def test_deal_lifecycle(client):
     # 5. Verify it's gone (GET /{id} -> 404)
     response = client.get(f"/deals/{deal_id}")
     assert response.status_code == 404
+
+def test_deal_list_cursor_pagination(client):
+    payload = {
+        "event_id": 999,
+        "discount_rate": 10,
+        "starts_at": datetime.utcnow().isoformat(),
+        "ends_at": (datetime.utcnow() + timedelta(days=1)).isoformat()
+    }
+    ids = [client.post("/deals/", json=payload).json()["id"] for _ in range(3)]
+
+    # 최신순: 첫 페이지는 마지막에 만든 두 개
+    response = client.get("/deals/", params={"limit": 2})
+    assert response.status_code == 200
+    assert [d["id"] for d in response.json()] == [ids[2], ids[1]]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get("/deals/", params={"limit": 2, "cursor": cursor})
+    assert response.status_code == 200
+    assert response.json()[0]["id"] == ids[0]
+
+    assert client.get("/deals/", params={"limit": 1000}).status_code == 422
+    assert client.get("/deals/", params={"cursor": "not-a-cursor"}).status_code == 400
+
+    for deal_id in ids:
+        client.delete(f"/deals/{deal_id}")
+
+def test_active_deals(client):
+    now = datetime.utcnow()
+    event = client.post("/events/", json={
+        "place_id": 1,
+        "title": "Jazz Night",
+        "start_time": (now + timedelta(hours=3)).isoformat(),
+        "remaining_seats": 12
+    }).json()
+
+    def make_deal(starts, ends):
+        return client.post("/deals/", json={
+            "event_id": event["id"],
+            "discount_rate": 30,
+            "starts_at": starts.isoformat(),
+            "ends_at": ends.isoformat()
+        }).json()
+
+    active = make_deal(now - timedelta(hours=1), now + timedelta(hours=2))
+    expired = make_deal(now - timedelta(hours=5), now - timedelta(hours=1))
+    upcoming = make_deal(now + timedelta(hours=1), now + timedelta(hours=2))
+
+    response = client.get("/deals/active", params={"event_id": event["id"]})
+    assert response.status_code == 200
+    deals = response.json()
+    assert [d["id"] for d in deals] == [active["id"]]
+    assert deals[0]["remaining_seats"] == 12
+    assert deals[0]["place_id"] == 1
+    assert deals[0]["event_start_time"].startswith(event["start_time"][:16])
+
+    # 기준 시각을 옮기면 예정 딜이 유효해짐
+    later = (now + timedelta(minutes=90)).isoformat()
+    response = client.get("/deals/active", params={"event_id": event["id"], "at": later})
+    assert {d["id"] for d in response.json()} == {active["id"], upcoming["id"]}
+
+    response = client.get("/deals/active", params={"place_id": 2})
+    assert active["id"] not in {d["id"] for d in response.json()}
+
+    for deal in (active, expired, upcoming):
+        client.delete(f"/deals/{deal['id']}")
+    client.delete(f"/events/{event['id']}")
+
+def test_recommend_batch_matches_scalar(client):
+    rows = [
+        {"event_id": 1, "remaining_seats": 5, "minutes_to_start": 30, "total_capacity": 50},
+        {"event_id": 2, "remaining_seats": 0, "minutes_to_start": 3, "total_capacity": 40},
+        {"event_id": 3, "remaining_seats": 7, "minutes_to_start": 90, "total_capacity": 0},
+        {"event_id": 4, "remaining_seats": 33, "minutes_to_start": 0, "total_capacity": 99},
+    ]
+    response = client.post("/deals/recommend/batch", json={"rows": rows})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["event_id"] for line in lines] == [1, 2, 3, 4]
+
+    for row, line in zip(rows, lines):
+        scalar = client.post("/deals/recommend", json=row).json()
+        assert line["discount_rate"] == scalar["discount_rate"]
+        assert line["discounted_price"] == scalar["discounted_price"]
+
+    assert client.post("/deals/recommend/batch", json={}).status_code == 422
+
+def test_recommend_batch_by_event_ids(client):
+    event = client.post("/events/", json={
+        "place_id": 1,
+        "title": "Midnight Movie",
+        "start_time": (datetime.utcnow() + timedelta(minutes=10, seconds=30)).isoformat(),
+        "remaining_seats": 10,
+        "total_capacity": 40
+    }).json()
+
+    response = client.post("/deals/recommend/batch", json={"event_ids": [event["id"], 987654]})
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    # 없는 이벤트는 건너뜀, 점유율 0.75 * 20 + 10분 * 2 = 35
+    assert len(lines) == 1
+    assert lines[0]["event_id"] == event["id"]
+    assert lines[0]["discount_rate"] == 35
+
+    client.delete(f"/events/{event['id']}")
@@ -0,0 +1,103 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db import Base, get_db
+from app.main import app
+
+
+def test_event_lifecycle(client):
+    payload = {
+        "place_id": 1,
+        "title": "Jazz Night",
+        "start_time": (datetime.utcnow() + timedelta(days=1)).isoformat(),
+        "remaining_seats": 20
+    }
+    response = client.post("/events/", json=payload)
+    assert response.status_code == 201
+    event_id = response.json()["id"]
+
+    response = client.patch(f"/events/{event_id}", json={"remaining_seats": 15})
+    assert response.status_code == 200
+    assert response.json()["remaining_seats"] == 15
+    assert response.json()["title"] == "Jazz Night"
+
+    assert client.get(f"/events/{event_id}").json()["remaining_seats"] == 15
+    assert client.delete(f"/events/{event_id}").status_code == 204
+    assert client.get(f"/events/{event_id}").status_code == 404
+
+
+def test_reserve_seats(client):
+    event = client.post("/events/", json={
+        "place_id": 1,
+        "title": "Midnight Movie",
+        "start_time": (datetime.utcnow() + timedelta(hours=5)).isoformat(),
+        "remaining_seats": 3
+    }).json()
+
+    response = client.post(f"/events/{event['id']}/reserve", json={"seats": 2})
+    assert response.status_code == 200
+    assert response.json() == {"event_id": event["id"], "reserved": 2, "remaining_seats": 1}
+
+    # 남은 좌석보다 많이 요청하면 409, 좌석 수는 그대로
+    assert client.post(f"/events/{event['id']}/reserve", json={"seats": 2}).status_code == 409
+    assert client.get(f"/events/{event['id']}").json()["remaining_seats"] == 1
+
+    assert client.post("/events/987654/reserve", json={"seats": 1}).status_code == 404
+    client.delete(f"/events/{event['id']}")
+
+
+async def _reserve_burst(seats: int, buyers: int) -> tuple[list[int], int]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        event = (await ac.post("/events/", json={
+            "place_id": 1,
+            "title": "Sold Out Show",
+            "start_time": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
+            "remaining_seats": seats
+        })).json()
+
+        responses = await asyncio.gather(*[
+            ac.post(f"/events/{event['id']}/reserve", json={"seats": 1})
+            for _ in range(buyers)
+        ])
+        remaining = (await ac.get(f"/events/{event['id']}")).json()["remaining_seats"]
+        await ac.delete(f"/events/{event['id']}")
+    return [r.status_code for r in responses], remaining
+
+
+# TEST_POSTGRES_URL (예: postgresql+asyncpg://user:pw@localhost:5432/test)이 있으면 PostgreSQL로도 실행
+@pytest.mark.parametrize("backend", ["sqlite", "postgresql"])
+def test_reserve_seats_never_oversells_under_concurrency(backend):
+    if backend == "postgresql":
+        url = os.getenv("TEST_POSTGRES_URL")
+        if not url:
+            pytest.skip("TEST_POSTGRES_URL not set")
+        pg_engine = create_async_engine(url, pool_size=20, max_overflow=20)
+        pg_session = async_sessionmaker(bind=pg_engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def pg_get_db():
+            async with pg_session() as db:
+                yield db
+
+        async def create_tables():
+            async with pg_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+        asyncio.run(create_tables())
+        previous = app.dependency_overrides[get_db]
+        app.dependency_overrides[get_db] = pg_get_db
+
+    try:
+        statuses, remaining = asyncio.run(_reserve_burst(seats=30, buyers=200))
+    finally:
+        if backend == "postgresql":
+            app.dependency_overrides[get_db] = previous
+
+    assert statuses.count(200) == 30
+    assert statuses.count(409) == 170
+    assert remaining == 0
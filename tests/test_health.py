@@ -2,3 +2,11 @@ def test_health(client):
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+def test_health_pool(client):
+    response = client.get("/health/pool")
+    assert response.status_code == 200
+    data = response.json()
+    assert "pool_class" in data
+    assert "checkouts_total" in data
+    assert "wait_ms_max" in data
@@ -0,0 +1,81 @@
+def test_place_lifecycle(client):
+    # 1. Create (POST)
+    payload = {
+        "name": "Club Evans",
+        "category": "band_club",
+        "tags": "jazz,indie,live",
+        "latitude": 37.555,
+        "longitude": 126.920
+    }
+    response = client.post("/places/", json=payload)
+    assert response.status_code == 201
+    place_id = response.json()["id"]
+
+    # 2. Get (GET /{id})
+    response = client.get(f"/places/{place_id}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Club Evans"
+
+    # 3. Update (PATCH)
+    response = client.patch(f"/places/{place_id}", json={"name": "Club Evans Hongdae"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Club Evans Hongdae"
+    assert response.json()["category"] == "band_club"
+
+    # 4. Delete (DELETE) -> 404
+    assert client.delete(f"/places/{place_id}").status_code == 204
+    assert client.get(f"/places/{place_id}").status_code == 404
+
+def test_nearby_places(client):
+    base = {"category": "cinema", "tags": None}
+    near = client.post("/places/", json={**base, "name": "Near", "latitude": 37.5551, "longitude": 126.9201}).json()
+    mid = client.post("/places/", json={**base, "name": "Mid", "latitude": 37.5600, "longitude": 126.9250}).json()
+    far = client.post("/places/", json={**base, "name": "Far", "latitude": 35.1796, "longitude": 129.0756}).json()
+
+    response = client.get("/places/nearby", params={"lat": 37.555, "lng": 126.920, "radius_m": 1500})
+    assert response.status_code == 200
+    results = response.json()
+    ids = [p["id"] for p in results]
+
+    # 거리순 정렬, 반경 밖(부산)은 제외
+    assert ids.index(near["id"]) < ids.index(mid["id"])
+    assert far["id"] not in ids
+    assert results[0]["distance_m"] <= results[-1]["distance_m"]
+
+    # 좌표를 옮기면 geohash도 다시 계산되어 검색 결과에 반영
+    client.patch(f"/places/{far['id']}", json={"latitude": 37.5552, "longitude": 126.9202})
+    response = client.get("/places/nearby", params={"lat": 37.555, "lng": 126.920, "radius_m": 1500})
+    assert far["id"] in [p["id"] for p in response.json()]
+
+    for p in (near, mid, far):
+        client.delete(f"/places/{p['id']}")
+
+def test_filter_places_by_tags(client):
+    base = {"category": "band_club", "latitude": 37.55, "longitude": 126.92}
+    jazz = client.post("/places/", json={**base, "name": "Jazz Bar", "tags": "Jazz, live"}).json()
+    both = client.post("/places/", json={**base, "name": "Indie Jazz", "tags": "indie,jazz"}).json()
+    indie = client.post("/places/", json={**base, "name": "Indie Hall", "tags": "indie,indie-rock"}).json()
+
+    # 저장 시 소문자/공백 정리
+    assert jazz["tags"] == "jazz,live"
+
+    response = client.get("/places/", params={"tags": "indie,jazz"})
+    ids = {p["id"] for p in response.json()}
+    assert {jazz["id"], both["id"], indie["id"]} <= ids
+
+    response = client.get("/places/", params={"tags": "indie,jazz", "match": "all"})
+    ids = {p["id"] for p in response.json()}
+    assert both["id"] in ids
+    assert jazz["id"] not in ids and indie["id"] not in ids
+
+    # 부분 문자열(indie-rock)은 indie와 매칭되지 않음
+    response = client.get("/places/", params={"tags": "rock"})
+    assert indie["id"] not in {p["id"] for p in response.json()}
+
+    # 태그 수정 시 인덱스도 교체
+    client.patch(f"/places/{jazz['id']}", json={"tags": "blues"})
+    response = client.get("/places/", params={"tags": "jazz"})
+    assert jazz["id"] not in {p["id"] for p in response.json()}
+
+    for p in (jazz, both, indie):
+        client.delete(f"/places/{p['id']}")
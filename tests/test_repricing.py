@@ -0,0 +1,41 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from app.repricing import RepricingScheduler
+from tests.conftest import TestingSessionLocal
+
+
+def test_repricing_tick_upserts_auto_deals(client):
+    now = datetime.utcnow()
+    soon = client.post("/events/", json={
+        "place_id": 1,
+        "title": "Soon",
+        "start_time": (now + timedelta(minutes=30)).isoformat(),
+        "remaining_seats": 10,
+        "total_capacity": 40
+    }).json()
+    later = client.post("/events/", json={
+        "place_id": 1,
+        "title": "Next Week",
+        "start_time": (now + timedelta(days=7)).isoformat(),
+        "remaining_seats": 10
+    }).json()
+
+    scheduler = RepricingScheduler(TestingSessionLocal, window=timedelta(hours=1))
+    asyncio.run(scheduler.tick())
+    # 두 번째 tick은 같은 자동 딜을 갱신 (중복 생성 X)
+    asyncio.run(scheduler.tick())
+
+    assert scheduler.stats["ticks"] == 2
+    assert scheduler.stats["last_upserted"] >= 1
+    assert scheduler.stats["last_tick_ms"] is not None
+
+    deals = client.get("/deals/active", params={"event_id": soon["id"]}).json()
+    assert len(deals) == 1
+    assert deals[0]["is_auto"] is True
+    assert deals[0]["discount_rate"] > 0
+    assert client.get("/deals/active", params={"event_id": later["id"]}).json() == []
+
+    client.delete(f"/deals/{deals[0]['id']}")
+    client.delete(f"/events/{soon['id']}")
+    client.delete(f"/events/{later['id']}")